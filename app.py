@@ -1,11 +1,21 @@
 import streamlit as st
+import functools
 import os
 import json
 import glob
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
 import pandas as pd
 import re
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
 st.set_page_config(
     page_title="LiveBench Results Viewer",
     page_icon="📊",
@@ -15,6 +25,21 @@ st.set_page_config(
 # Define paths
 BASE_DATA_PATH = "livebench/data/live_bench"
 
+# Surface swallowed file/parse errors as warnings when debugging the viewer
+SHOW_DEBUG_WARNINGS = bool(os.environ.get("LIVEBENCH_VIEWER_DEBUG"))
+
+# Judgment files larger than this are streamed line-by-line instead of
+# being materialized in full before aggregation
+_STREAM_THRESHOLD_BYTES = 50 * 1024 * 1024
+
+# Precompiled patterns for response cleaning and code extraction
+_PY_CODE_RE = re.compile(r'```(?:python|py)\s*([\s\S]*?)```')
+_ANY_CODE_RE = re.compile(r'```([\s\S]*?)```')
+_EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+_THINK_BLOCK_RE = re.compile(r'<think>[\s\S]*?</think>')
+_SOLUTION_PREAMBLE_RE = re.compile(r'^(here\'s|here is)(\s+the)?(\s+solution|\s+code|\s+answer).*?:\s*', re.IGNORECASE)
+_APPROACH_PREAMBLE_RE = re.compile(r'^(my solution|my approach|solution|approach).*?:\s*', re.IGNORECASE)
+
 # Custom CSS
 st.markdown("""
 <style>
@@ -43,87 +68,259 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+def _file_stamp(path):
+    """Return a value that changes whenever the file (or directory) at path changes.
+
+    Used as an extra cache key so @st.cache_data entries are invalidated when the
+    underlying file is rewritten. Returns None for missing paths.
+    """
+    try:
+        stat = os.stat(path)
+        return (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return None
+
+@st.cache_data(show_spinner=False)
+def _load_jsonl_cached(file_path, stamp):
+    """Load data from a JSONL file, cached on (path, mtime, size)."""
+    # Read the whole file in one syscall; orjson parses bytes directly, so
+    # binary mode also skips the up-front UTF-8 decode.
+    with open(file_path, 'rb') as f:
+        buf = f.read()
+    return [_loads(line) for line in buf.splitlines() if line]
+
 def load_jsonl(file_path):
     """Load data from a JSONL file."""
-    data = []
-    with open(file_path, 'r', encoding='utf-8') as f:
+    return _load_jsonl_cached(file_path, _file_stamp(file_path))
+
+def iter_jsonl(file_path):
+    """Yield records from a JSONL file one at a time, without materializing the list."""
+    with open(file_path, 'rb') as f:
         for line in f:
-            data.append(json.loads(line))
-    return data
+            if line.strip():
+                yield _loads(line)
+
+@functools.lru_cache(maxsize=None)
+def path_exists(path):
+    """Cached os.path.exists for the render path; cleared at the start of each rerun.
+
+    The same handful of paths is probed many times while rendering (once per model
+    in the comparison tab), and each probe is a stat syscall."""
+    return os.path.exists(path)
+
+def dumps_pretty(obj):
+    """Serialize obj to indented JSON for display, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+@st.cache_data(show_spinner=False)
+def _list_subdirs(path, stamp):
+    """List subdirectory names of path, cached on the directory mtime."""
+    # scandir exposes is_dir() from the directory entry itself, avoiding a stat per entry
+    with os.scandir(path) as entries:
+        return sorted(entry.name for entry in entries if entry.is_dir())
 
 def get_categories():
     """Get all categories from the data folder."""
-    return sorted([d for d in os.listdir(BASE_DATA_PATH) if os.path.isdir(os.path.join(BASE_DATA_PATH, d))])
+    return _list_subdirs(BASE_DATA_PATH, _file_stamp(BASE_DATA_PATH))
 
 def get_tasks(category):
     """Get all tasks for a specific category."""
     category_path = os.path.join(BASE_DATA_PATH, category)
-    return sorted([d for d in os.listdir(category_path) if os.path.isdir(os.path.join(category_path, d))])
+    return _list_subdirs(category_path, _file_stamp(category_path))
 
-def get_models(category, task):
-    """Get all models for a specific task."""
+@st.cache_data(show_spinner=False)
+def _list_models(task_path, stamp):
+    """List model names (jsonl file stems) in task_path, cached on the directory mtime."""
     models = set()
-    task_path = os.path.join(BASE_DATA_PATH, category, task, "model_answer")
     if os.path.exists(task_path):
-        for file in os.listdir(task_path):
-            if file.endswith(".jsonl"):
-                models.add(file.split(".")[0])
+        with os.scandir(task_path) as entries:
+            for entry in entries:
+                if entry.name.endswith(".jsonl"):
+                    # strip only the extension; model names may contain dots
+                    models.add(entry.name[:-len(".jsonl")])
     return sorted(list(models))
 
+def get_models(category, task):
+    """Get all models for a specific task."""
+    task_path = os.path.join(BASE_DATA_PATH, category, task, "model_answer")
+    return _list_models(task_path, _file_stamp(task_path))
+
+@st.cache_data(show_spinner=False)
+def _load_judgment_index_cached(judgment_path, stamp):
+    """Parse the judgment file once into (question_id, model) -> score and -> metadata
+    maps plus precomputed per-model score statistics, cached on the judgment file mtime."""
+    scores = {}
+    metadata = {}
+    model_stats = {}
+    if not os.path.exists(judgment_path):
+        return scores, model_stats, metadata
+
+    if os.path.getsize(judgment_path) > _STREAM_THRESHOLD_BYTES:
+        # Stream pathological files line-by-line and aggregate incrementally,
+        # keeping memory bounded by the index rather than the raw records
+        acc = {}
+        for item in iter_jsonl(judgment_path):
+            model = item.get("model")
+            score = item.get("score", None)
+            key = (item.get("question_id"), model)
+            scores[key] = score
+            if "metadata" in item:
+                metadata[key] = item["metadata"]
+            if score is not None:
+                entry = acc.get(model)
+                if entry is None:
+                    acc[model] = [score, score, score, 1]
+                else:
+                    entry[0] += score
+                    entry[1] = min(entry[1], score)
+                    entry[2] = max(entry[2], score)
+                    entry[3] += 1
+        model_stats = {
+            model: {"mean": total / count, "min": low, "max": high, "count": count}
+            for model, (total, low, high, count) in acc.items()
+        }
+        return scores, model_stats, metadata
+
+    # Prefer a Parquet sidecar from an earlier load; columnar and typed, it
+    # reads far faster than re-parsing the JSONL
+    parquet_path = judgment_path + ".parquet"
+    df = None
+    try:
+        if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(judgment_path):
+            df = pd.read_parquet(parquet_path, engine="pyarrow")
+    except (ImportError, OSError, ValueError):
+        df = None
+
+    parsed_from_jsonl = False
+    if df is None:
+        try:
+            # The Arrow engine parses JSONL in a C pipeline, much faster than per-line loads
+            df = pd.read_json(judgment_path, lines=True, engine="pyarrow")
+            parsed_from_jsonl = True
+        except (ImportError, ValueError):
+            df = None
+
+    if parsed_from_jsonl and df is not None and os.access(os.path.dirname(judgment_path), os.W_OK):
+        # Write the sidecar atomically so a concurrent reader never sees a partial file
+        try:
+            tmp_path = parquet_path + ".tmp"
+            df.to_parquet(tmp_path, engine="pyarrow")
+            os.replace(tmp_path, parquet_path)
+        except (ImportError, OSError, ValueError) as e:
+            if SHOW_DEBUG_WARNINGS:
+                st.warning(f"Could not write parquet sidecar for {judgment_path}: {e}")
+
+    if df is not None and {"question_id", "model", "score"}.issubset(df.columns):
+        keys = list(zip(df["question_id"], df["model"]))
+        scores = {key: (None if pd.isna(score) else score) for key, score in zip(keys, df["score"])}
+        if "metadata" in df.columns:
+            metadata = {key: m for key, m in zip(keys, df["metadata"]) if isinstance(m, (dict, list, str))}
+    else:
+        # Fallback: per-line parse when pyarrow is unavailable or the file shape is unusual
+        rows = []
+        for item in load_jsonl(judgment_path):
+            model = item.get("model")
+            score = item.get("score", None)
+            key = (item.get("question_id"), model)
+            scores[key] = score
+            if "metadata" in item:
+                metadata[key] = item["metadata"]
+            if score is not None:
+                rows.append((model, score))
+        df = pd.DataFrame(rows, columns=["model", "score"])
+
+    if len(df):
+        # One vectorized groupby pass instead of a Python filter per model
+        agg = df.dropna(subset=["score"]).groupby("model")["score"].agg(["mean", "min", "max", "count"])
+        model_stats = agg.to_dict("index")
+    return scores, model_stats, metadata
+
+def load_judgment_index(category, task):
+    """Get the cached judgment index for a task: (scores map, per-model stats, metadata map)."""
+    judgment_path = os.path.join(BASE_DATA_PATH, category, task, "model_judgment", "ground_truth_judgment.jsonl")
+    return _load_judgment_index_cached(judgment_path, _file_stamp(judgment_path))
+
 def get_judgments(category, task):
     """Get judgment data for a specific task."""
-    judgments = {}
+    return load_judgment_index(category, task)[0]
+
+@st.cache_data(show_spinner=False)
+def _ground_truth_cached(judgment_path, question_id, model, stamp):
+    """All judgment records for one (question, model) pair, cached on the file mtime."""
+    return [
+        item for item in iter_jsonl(judgment_path)
+        if item.get("question_id") == question_id and item.get("model") == model
+    ]
+
+def get_ground_truth(category, task, question_id, model):
+    """Get the ground truth judgment records for a question and model."""
     judgment_path = os.path.join(BASE_DATA_PATH, category, task, "model_judgment", "ground_truth_judgment.jsonl")
-    if os.path.exists(judgment_path):
-        judgment_data = load_jsonl(judgment_path)
-        for item in judgment_data:
-            key = (item.get("question_id"), item.get("model"))
-            judgments[key] = item.get("score", None)
-    return judgments
+    if not path_exists(judgment_path):
+        return []
+    return _ground_truth_cached(judgment_path, question_id, model, _file_stamp(judgment_path))
+
+@st.cache_data(show_spinner=False)
+def _index_by_qid_cached(file_path, stamp):
+    """Index a JSONL file's records by question_id, cached on the file mtime."""
+    if not os.path.exists(file_path):
+        return {}
+    return {record.get("question_id"): record for record in load_jsonl(file_path)}
+
+def index_by_qid(file_path):
+    """Get the cached question_id -> record index for a JSONL file."""
+    return _index_by_qid_cached(file_path, _file_stamp(file_path))
+
+def load_answers_index(category, task, model):
+    """Get the cached question_id -> answer index for a model on a task."""
+    answer_file = os.path.join(BASE_DATA_PATH, category, task, "model_answer", f"{model}.jsonl")
+    return index_by_qid(answer_file)
+
+@st.cache_data(show_spinner=False)
+def _build_rules_index_cached(rules_files, stamps):
+    """Index every rule in rules_files by question_id, cached on the file mtimes."""
+    index = {}
+    for rules_file in rules_files:
+        try:
+            for rule in iter_jsonl(rules_file):
+                index[rule.get("question_id")] = rule
+        except (OSError, ValueError):
+            continue
+    return index
+
+def get_rules_index(category, task):
+    """Get the cached question_id -> rule index for a task's *_rules files."""
+    rules_path = os.path.join(BASE_DATA_PATH, category, task, "questions")
+    rules_files = tuple(sorted(
+        glob.glob(os.path.join(rules_path, "*_rules.jsonl"))
+        + glob.glob(os.path.join(rules_path, "*_rules.json"))
+    ))
+    return _build_rules_index_cached(rules_files, tuple(_file_stamp(f) for f in rules_files))
 
 def get_all_question_answers(category, task, question_id):
     """Get all model answers for a specific question."""
-    models = get_models(category, task)
     model_answers = {}
-    
-    for model in models:
-        answer_file = os.path.join(BASE_DATA_PATH, category, task, "model_answer", f"{model}.jsonl")
-        if os.path.exists(answer_file):
-            answers = load_jsonl(answer_file)
-            for answer in answers:
-                if answer.get("question_id") == question_id:
-                    model_answers[model] = answer
-                    break
-    
+    for model in get_models(category, task):
+        answer = load_answers_index(category, task, model).get(question_id)
+        if answer is not None:
+            model_answers[model] = answer
     return model_answers
 
 def get_model_stats(category, task, model):
     """Get score statistics for a model on a task."""
-    judgments = get_judgments(category, task)
-    
-    model_scores = [score for (qid, model_name), score in judgments.items() if model_name == model]
-    
-    if model_scores:
-        return {
-            "mean": sum(model_scores) / len(model_scores),
-            "min": min(model_scores),
-            "max": max(model_scores),
-            "count": len(model_scores)
-        }
-    return None
+    return load_judgment_index(category, task)[1].get(model)
 
 def get_question_text(category, task, question_id):
     """Get the original question text for a given question ID."""
     # Look for question.jsonl file in the category/task directory
     question_file_path = os.path.join(BASE_DATA_PATH, category, task, "question.jsonl")
-    
-    if os.path.exists(question_file_path):
-        questions = load_jsonl(question_file_path)
-        for question in questions:
-            if question.get("question_id") == question_id:
-                # Extract the actual prompt/question text
-                return question.get("turns", None)
-    
+
+    question = index_by_qid(question_file_path).get(question_id)
+    if question is not None:
+        # Extract the actual prompt/question text
+        return question.get("turns", None)
+
     return None
 
 
@@ -133,19 +330,18 @@ def format_question_content(question_data):
 
 def extract_code(text):
     """Extract Python code from text that might have markdown code blocks."""
-    if not text:
+    # Cheap substring test to skip the regex engine when there are no code blocks
+    if not text or '```' not in text:
         return text
-    
+
     # First check for Python code blocks with language specifier
-    python_pattern = r'```(?:python|py)\s*([\s\S]*?)```'
-    matches = re.findall(python_pattern, text)
-    
+    matches = _PY_CODE_RE.findall(text)
+
     if matches:
         return '\n\n'.join(matches)
-    
+
     # Then check for any code blocks
-    code_pattern = r'```([\s\S]*?)```'
-    matches = re.findall(code_pattern, text)
+    matches = _ANY_CODE_RE.findall(text)
     
     if matches:
         return '\n\n'.join(matches)
@@ -159,22 +355,35 @@ def clean_model_response(text):
         return ""
         
     # Remove excessive newlines (more than 2 in a row)
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    
+    text = _EXCESS_NEWLINES_RE.sub('\n\n', text)
+
     # Remove <think>...</think> blocks used by some models for internal reasoning
-    text = re.sub(r'<think>[\s\S]*?</think>', '', text)
-    
-    # Remove "Here is the solution" preambles that often appear in coding answers
-    text = re.sub(r'(?i)^(here\'s|here is)(\s+the)?(\s+solution|\s+code|\s+answer).*?:\s*', '', text)
-    text = re.sub(r'(?i)^(my solution|my approach|solution|approach).*?:\s*', '', text)
+    if '<think>' in text:
+        text = _THINK_BLOCK_RE.sub('', text)
+
+    # Remove "Here is the solution" preambles that often appear in coding answers;
+    # a cheap startswith test avoids the IGNORECASE regex on the common case.
+    # The prefix is re-checked after the first sub, which can expose a stacked
+    # "My approach:"-style preamble underneath
+    if text[:12].lower().startswith(("here's", "here is")):
+        text = _SOLUTION_PREAMBLE_RE.sub('', text)
+    if text[:12].lower().startswith(("my solution", "my approach", "solution", "approach")):
+        text = _APPROACH_PREAMBLE_RE.sub('', text)
     
     return text.strip()
 
+class ResponseItem(NamedTuple):
+    """One displayable piece of a formatted model response."""
+    type: str
+    content: str
+    label: str = ""
+    language: str = "python"
+
 def format_model_response(selected_answer, category, task):
     """Format the model response for better display."""
     response_content = []
     model_text = ""
-    
+
     # First, try to get the raw model output text from common fields
     if "text" in selected_answer:
         model_text = selected_answer["text"]
@@ -188,72 +397,42 @@ def format_model_response(selected_answer, category, task):
             elif "turns" in choice and choice["turns"]:
                 model_text = choice["turns"][0]
                 break
-    
+
+    # Clean the raw text once; both branches below reuse the result
+    cleaned_text = clean_model_response(model_text)
+
     # For coding tasks, prioritize showing code extractions
     if category == "coding":
-        has_code = False
-        
-        # Try to extract code from the model text
-        code = extract_code(model_text)
-        if code and code != model_text:
-            has_code = True
-            # Add the full response first
-            cleaned_text = clean_model_response(model_text)
-            if cleaned_text:
-                response_content.append({
-                    "type": "text",
-                    "content": cleaned_text,
-                    "label": "Complete Response"
-                })
-            
-        else:
-            # If we couldn't extract distinct code, show the full response
-            cleaned_text = clean_model_response(model_text)
-            if cleaned_text:
-                response_content.append({
-                    "type": "text",
-                    "content": cleaned_text,
-                    "label": "Model Response"
-                })
-        
+        has_code = '```' in model_text
+
+        if cleaned_text:
+            label = "Complete Response" if has_code else "Model Response"
+            response_content.append(ResponseItem("text", cleaned_text, label))
+
         # If no code was found, check different fields
         if not has_code and not response_content:
             for key, value in selected_answer.items():
                 if key not in ["question_id", "model_id", "answer_id", "choices", "text", "model_output", "tstamp"] and isinstance(value, str):
                     code = extract_code(value)
                     if code and code != value:
-                        response_content.append({
-                            "type": "code",
-                            "content": code,
-                            "language": "python",
-                            "label": f"Code from {key}"
-                        })
+                        response_content.append(ResponseItem("code", code, f"Code from {key}"))
                         break
-    
+
     # For non-coding tasks, display the full response text
     else:
-        cleaned_text = clean_model_response(model_text)
         if cleaned_text:
-            response_content.append({
-                "type": "text",
-                "content": cleaned_text,
-                "label": "Model Response"
-            })
-    
+            response_content.append(ResponseItem("text", cleaned_text, "Model Response"))
+
     # If we still have no content, try to parse any field that might contain the answer
     if not response_content:
         for key, value in selected_answer.items():
             if key not in ["question_id", "model_id", "answer_id", "tstamp"] and isinstance(value, str) and len(value) > 10:
-                cleaned_text = clean_model_response(value)
-                response_content.append({
-                    "type": "text",
-                    "content": cleaned_text,
-                    "label": f"Content from {key}"
-                })
+                response_content.append(ResponseItem("text", clean_model_response(value), f"Content from {key}"))
                 break
-    
+
     return response_content
 
+@st.cache_data(show_spinner=False)
 def format_judgment_explanation(judgment_data, category, task):
     """Format judgment data with explanations of the scoring criteria."""
     if not judgment_data:
@@ -286,26 +465,15 @@ def get_test_case_results(category, task, question_id, model):
     """Try to extract test case results for coding tasks."""
     if category != "coding":
         return None
-        
-    # Look for test case results metadata in the judgment file
-    judgment_path = os.path.join(BASE_DATA_PATH, category, task, "model_judgment", "ground_truth_judgment.jsonl")
-    if not os.path.exists(judgment_path):
-        return None
-        
-    try:
-        judgments = load_jsonl(judgment_path)
-        for judgment in judgments:
-            if judgment.get("question_id") == question_id and judgment.get("model") == model:
-                if "metadata" in judgment:
-                    return judgment["metadata"]
-                # If metadata isn't in the judgment, we can't show test case results
-                return None
-    except:
-        pass
-    
-    # If we failed to extract from the judgment file, try to look in the evaluation results
+
+    # Test case results are stored as metadata in the judgment file
+    metadata = load_judgment_index(category, task)[2].get((question_id, model))
+    if metadata is not None:
+        return metadata
+
+    # If there was no metadata in the judgment file, try to look in the evaluation results
     eval_path = os.path.join(BASE_DATA_PATH, category, task, "evaluation_results")
-    if not os.path.exists(eval_path):
+    if not path_exists(eval_path):
         return None
         
     try:
@@ -315,12 +483,17 @@ def get_test_case_results(category, task, question_id, model):
                     eval_data = json.load(f)
                     if question_id in eval_data:
                         return eval_data[question_id]
-    except:
-        pass
-        
+    except (OSError, ValueError) as e:
+        if SHOW_DEBUG_WARNINGS:
+            st.warning(f"Could not read evaluation results for {model}: {e}")
+
     return None
 
 def main():
+    # Existence checks are only memoized within a single rerun so that
+    # files written between interactions are picked up
+    path_exists.cache_clear()
+
     st.title("LiveBench Results Viewer")
     
     # Sidebar for navigation
@@ -347,7 +520,7 @@ def main():
                     # Load model answers
                     answer_file = os.path.join(BASE_DATA_PATH, selected_category, selected_task, "model_answer", f"{selected_model}.jsonl")
                     
-                    if os.path.exists(answer_file):
+                    if path_exists(answer_file):
                         # Load answers and judgments
                         answers = load_jsonl(answer_file)
                         judgments = get_judgments(selected_category, selected_task)
@@ -399,88 +572,72 @@ def main():
                                 # Display model response
                                 response_content = format_model_response(selected_answer, selected_category, selected_task)
                                 for item in response_content:
-                                    if "label" in item:
-                                        st.subheader(item["label"])
-                                    if item["type"] == "code":
-                                        st.code(item["content"], language=item["language"])
+                                    if item.label:
+                                        st.subheader(item.label)
+                                    if item.type == "code":
+                                        st.code(item.content, language=item.language)
                                     else:
-                                        st.markdown(item["content"])
+                                        st.markdown(item.content)
                                 
                                 # Try to find ground truth or rules
-                                rules_path = os.path.join(BASE_DATA_PATH, selected_category, selected_task, "questions")
                                 rules_found = False
-                                if os.path.exists(rules_path):
-                                    for file in os.listdir(rules_path):
-                                        if file.endswith("_rules.jsonl") or file.endswith("_rules.json"):
-                                            try:
-                                                rules_data = load_jsonl(os.path.join(rules_path, file))
-                                                for rule in rules_data:
-                                                    if rule.get("question_id") == question_id:
-                                                        st.subheader("Evaluation Rules")
-                                                        st.markdown(f'<div class="question-box">{json.dumps(rule, indent=2)}</div>', unsafe_allow_html=True)
-                                                        rules_found = True
-                                                        break
-                                            except:
-                                                pass
+                                rule = get_rules_index(selected_category, selected_task).get(question_id)
+                                if rule is not None:
+                                    st.subheader("Evaluation Rules")
+                                    st.markdown(f'<div class="question-box">{dumps_pretty(rule)}</div>', unsafe_allow_html=True)
+                                    rules_found = True
                                 
                                 # If no specific rules found, check if there's a ground truth judgment
                                 if not rules_found:
-                                    judgment_path = os.path.join(BASE_DATA_PATH, selected_category, selected_task, "model_judgment", "ground_truth_judgment.jsonl")
-                                    if os.path.exists(judgment_path):
-                                        ground_truth = []
-                                        judgment_data = load_jsonl(judgment_path)
-                                        for item in judgment_data:
-                                            if item.get("question_id") == question_id and item.get("model") == selected_model:
-                                                ground_truth.append(item)
+                                    ground_truth = get_ground_truth(selected_category, selected_task, question_id, selected_model)
+                                    if ground_truth:
+                                        st.subheader("Model Evaluation")
+                                        judgment_explanation = format_judgment_explanation(ground_truth, selected_category, selected_task)
                                         
-                                        if ground_truth:
-                                            st.subheader("Model Evaluation")
-                                            judgment_explanation = format_judgment_explanation(ground_truth, selected_category, selected_task)
-                                            
-                                            # Display score with explanation
-                                            score = judgment_explanation.get("score", "N/A")
-                                            st.metric("Score", f"{score}")
-                                            
-                                            if "details" in judgment_explanation:
-                                                st.markdown(f"**Evaluation Details**: {judgment_explanation['details']}")
-                                            
-                                            # For coding tasks, try to show test case results
-                                            if selected_category == "coding":
-                                                test_results = get_test_case_results(selected_category, selected_task, question_id, selected_model)
-                                                if test_results:
-                                                    st.subheader("Test Case Results")
-                                                    
-                                                    # Try to parse the test results
-                                                    try:
-                                                        if isinstance(test_results, str):
-                                                            test_results = json.loads(test_results)
-                                                            
-                                                        if isinstance(test_results, dict):
-                                                            # Display the test results in a readable format
-                                                            for test_key, test_value in test_results.items():
-                                                                if isinstance(test_value, (list, dict)):
-                                                                    st.json(test_value)
-                                                                else:
-                                                                    st.markdown(f"**{test_key}**: {test_value}")
-                                                        elif isinstance(test_results, list):
-                                                            # If it's a list of test results
-                                                            for i, result in enumerate(test_results):
-                                                                if isinstance(result, (int, bool)):
-                                                                    status = "✅ Passed" if result > 0 and result != -1 and result != -2 else "❌ Failed"
-                                                                    reason = ""
-                                                                    if result == -1:
-                                                                        reason = " (Runtime Error)"
-                                                                    elif result == -2:
-                                                                        reason = " (Compilation Error)"
-                                                                    st.markdown(f"**Test {i+1}**: {status}{reason}")
-                                                                else:
-                                                                    st.markdown(f"**Test {i+1}**: {result}")
-                                                    except:
-                                                        st.markdown("Test case results available but could not be parsed.")
-                                            
-                                            # Show raw judgment data in an expander for debugging
-                                            with st.expander("Raw Judgment Data"):
-                                                st.json(ground_truth)
+                                        # Display score with explanation
+                                        score = judgment_explanation.get("score", "N/A")
+                                        st.metric("Score", f"{score}")
+                                        
+                                        if "details" in judgment_explanation:
+                                            st.markdown(f"**Evaluation Details**: {judgment_explanation['details']}")
+                                        
+                                        # For coding tasks, try to show test case results
+                                        if selected_category == "coding":
+                                            test_results = get_test_case_results(selected_category, selected_task, question_id, selected_model)
+                                            if test_results:
+                                                st.subheader("Test Case Results")
+                                                
+                                                # Try to parse the test results
+                                                try:
+                                                    if isinstance(test_results, str):
+                                                        test_results = json.loads(test_results)
+                                                        
+                                                    if isinstance(test_results, dict):
+                                                        # Display the test results in a readable format
+                                                        for test_key, test_value in test_results.items():
+                                                            if isinstance(test_value, (list, dict)):
+                                                                st.json(test_value)
+                                                            else:
+                                                                st.markdown(f"**{test_key}**: {test_value}")
+                                                    elif isinstance(test_results, list):
+                                                        # If it's a list of test results
+                                                        for i, result in enumerate(test_results):
+                                                            if isinstance(result, (int, bool)):
+                                                                status = "✅ Passed" if result > 0 and result != -1 and result != -2 else "❌ Failed"
+                                                                reason = ""
+                                                                if result == -1:
+                                                                    reason = " (Runtime Error)"
+                                                                elif result == -2:
+                                                                    reason = " (Compilation Error)"
+                                                                st.markdown(f"**Test {i+1}**: {status}{reason}")
+                                                            else:
+                                                                st.markdown(f"**Test {i+1}**: {result}")
+                                                except (TypeError, ValueError):
+                                                    st.markdown("Test case results available but could not be parsed.")
+                                        
+                                        # Show raw judgment data in an expander for debugging
+                                        with st.expander("Raw Judgment Data"):
+                                            st.json(ground_truth)
                     else:
                         st.error(f"No answer file found for model {selected_model} in task {selected_task}")
             
@@ -489,14 +646,10 @@ def main():
                 
                 # Get all models for the task
                 models = get_models(selected_category, selected_task)
-                judgments = get_judgments(selected_category, selected_task)
-                
-                # Compute statistics for each model
-                model_stats = {}
-                for model in models:
-                    stats = get_model_stats(selected_category, selected_task, model)
-                    if stats:
-                        model_stats[model] = stats
+                _, stats_by_model, _ = load_judgment_index(selected_category, selected_task)
+
+                # Look up the precomputed statistics for each model
+                model_stats = {model: stats_by_model[model] for model in models if model in stats_by_model}
                 
                 # Create a dataframe for display
                 if model_stats:
@@ -516,14 +669,19 @@ def main():
                     # Show a single question across all models
                     st.subheader("Compare Answers to the Same Question")
                     
+                    # Load the per-model answer indexes in parallel on the cold path;
+                    # file IO and orjson decoding release the GIL, and warm calls are
+                    # served from the st.cache_data cache
+                    with ThreadPoolExecutor(max_workers=8) as executor:
+                        indexes = list(executor.map(
+                            lambda model: load_answers_index(selected_category, selected_task, model),
+                            models
+                        ))
+
                     # Get a list of all question IDs across all models
                     all_questions = set()
-                    for model in models:
-                        answer_file = os.path.join(BASE_DATA_PATH, selected_category, selected_task, "model_answer", f"{model}.jsonl")
-                        if os.path.exists(answer_file):
-                            answers = load_jsonl(answer_file)
-                            for answer in answers:
-                                all_questions.add(answer.get("question_id"))
+                    for index in indexes:
+                        all_questions.update(index.keys())
                     
                     question_id_options = sorted(list(all_questions))
                     if question_id_options:
@@ -545,20 +703,12 @@ def main():
                             
                             # Display model answers section
                             with st.expander("Model Answers", expanded=True):
+                                # Collect all model answers first, via the cached indexes
                                 model_answers = {}
-                                
-                                # Collect all model answers first
                                 for model_name in models:
-                                    model_answer_path = os.path.join(BASE_DATA_PATH, selected_category, selected_task, "model_answers", f"{model_name}.jsonl")
-                                    
-                                    if os.path.exists(model_answer_path):
-                                        answers_data = load_jsonl(model_answer_path)
-                                        
-                                        # Find the answer for the selected question
-                                        for answer in answers_data:
-                                            if answer.get("question_id") == selected_question_id:
-                                                model_answers[model_name] = answer
-                                                break
+                                    answer = load_answers_index(selected_category, selected_task, model_name).get(selected_question_id)
+                                    if answer is not None:
+                                        model_answers[model_name] = answer
                                 
                                 if model_answers:
                                     # Create columns for different models
@@ -567,104 +717,81 @@ def main():
                                     # Display each model's answer
                                     for i, (model_name, answer) in enumerate(model_answers.items()):
                                         with cols[i]:
-                                            # Format and display the model answer
-                                            st.markdown(f"## {model_name}")
+                                            # Build one markdown payload per column; every separate
+                                            # Streamlit call is a serialization round-trip to the browser
                                             response_text = answer.get("text", answer.get("model_output", ""))
                                             formatted_response = format_model_response(answer, selected_category, selected_task)
-                                            
+
+                                            md_parts = [f"## {model_name}"]
+                                            code_blocks = []
+                                            for item in formatted_response:
+                                                if item.label:
+                                                    md_parts.append(f"### {item.label}")
+                                                if item.type == "code":
+                                                    # keep code blocks separate for syntax highlighting
+                                                    code_blocks.append((item.content, item.language))
+                                                else:
+                                                    md_parts.append(item.content)
+                                            st.markdown("\n\n".join(md_parts))
+                                            for content, language in code_blocks:
+                                                st.code(content, language=language)
+
                                             if selected_category == "coding":
-                                                # For coding tasks, try to extract and display code block
+                                                # For coding tasks, also show the extracted code block
                                                 code = extract_code(response_text)
                                                 if code and code != response_text:
-                                                    with st.expander("Response", expanded=True):
-                                                        for item in formatted_response:
-                                                            if "label" in item:
-                                                                st.subheader(item["label"])
-                                                            if item["type"] == "text":
-                                                                st.markdown(item["content"])
                                                     with st.expander("Extracted Code", expanded=True):
                                                         st.code(code, language="python")
-                                                else:
-                                                    for item in formatted_response:
-                                                        if "label" in item:
-                                                            st.subheader(item["label"])
-                                                        if item["type"] == "code":
-                                                            st.code(item["content"], language=item["language"])
-                                                        else:
-                                                            st.markdown(item["content"])
-                                            else:
-                                                # For non-coding tasks, display the clean response
-                                                for item in formatted_response:
-                                                    if "label" in item:
-                                                        st.subheader(item["label"])
-                                                    if item["type"] == "code":
-                                                        st.code(item["content"], language=item["language"])
-                                                    else:
-                                                        st.markdown(item["content"])
-                                            
+
                                             # Display ground truth judgment if available
-                                            judgment_path = os.path.join(BASE_DATA_PATH, selected_category, selected_task, "model_judgment", "ground_truth_judgment.jsonl")
-                                            if os.path.exists(judgment_path):
-                                                ground_truth = []
-                                                judgment_data = load_jsonl(judgment_path)
-                                                for item in judgment_data:
-                                                    if item.get("question_id") == selected_question_id and item.get("model") == model_name:
-                                                        ground_truth.append(item)
-                                                
-                                                if ground_truth:
-                                                    with st.expander("Model Evaluation"):
-                                                        judgment_explanation = format_judgment_explanation(ground_truth, selected_category, selected_task)
-                                                        
-                                                        # Display score
-                                                        score = judgment_explanation.get("score", "N/A")
-                                                        st.metric("Score", f"{score}")
-                                                        
-                                                        # For coding tasks, try to show test results
-                                                        if selected_category == "coding":
-                                                            test_results = get_test_case_results(selected_category, selected_task, selected_question_id, model_name)
-                                                            if test_results:
-                                                                st.markdown("### Test Case Results")
-                                                                try:
-                                                                    if isinstance(test_results, str):
-                                                                        test_results = json.loads(test_results)
-                                                                        
-                                                                    if isinstance(test_results, list):
-                                                                        passed = sum(1 for r in test_results if r > 0 and r != -1 and r != -2)
-                                                                        total = len(test_results)
-                                                                        st.markdown(f"**Tests Passed**: {passed}/{total}")
-                                                                        
-                                                                        # Display individual test results
-                                                                        for i, result in enumerate(test_results):
-                                                                            status = "✅ Passed" if result > 0 else "❌ Failed"
-                                                                            if result == -1:
-                                                                                status = "⚠️ Error"
-                                                                            elif result == -2:
-                                                                                status = "⏱️ Timeout"
-                                                                            st.markdown(f"Test {i+1}: {status}")
-                                                                except Exception as e:
-                                                                    st.error(f"Error parsing test results: {e}")
-                                                        
-                                                        # Display evaluation criteria
-                                                        if "criteria" in judgment_explanation:
-                                                            st.markdown(f"**Scoring Criteria**: {judgment_explanation['criteria']}")
-                                                        
-                                                        if "details" in judgment_explanation:
-                                                            st.markdown(f"**Evaluation Details**: {judgment_explanation['details']}")
-                                
+                                            ground_truth = get_ground_truth(selected_category, selected_task, selected_question_id, model_name)
+                                            if ground_truth:
+                                                with st.expander("Model Evaluation"):
+                                                    judgment_explanation = format_judgment_explanation(ground_truth, selected_category, selected_task)
+                                                    
+                                                    # Display score
+                                                    score = judgment_explanation.get("score", "N/A")
+                                                    st.metric("Score", f"{score}")
+                                                    
+                                                    # For coding tasks, try to show test results
+                                                    if selected_category == "coding":
+                                                        test_results = get_test_case_results(selected_category, selected_task, selected_question_id, model_name)
+                                                        if test_results:
+                                                            st.markdown("### Test Case Results")
+                                                            try:
+                                                                if isinstance(test_results, str):
+                                                                    test_results = json.loads(test_results)
+                                                                    
+                                                                if isinstance(test_results, list):
+                                                                    passed = sum(1 for r in test_results if r > 0 and r != -1 and r != -2)
+                                                                    total = len(test_results)
+                                                                    st.markdown(f"**Tests Passed**: {passed}/{total}")
+                                                                    
+                                                                    # Display individual test results
+                                                                    for i, result in enumerate(test_results):
+                                                                        status = "✅ Passed" if result > 0 else "❌ Failed"
+                                                                        if result == -1:
+                                                                            status = "⚠️ Error"
+                                                                        elif result == -2:
+                                                                            status = "⏱️ Timeout"
+                                                                        st.markdown(f"Test {i+1}: {status}")
+                                                            except Exception as e:
+                                                                st.error(f"Error parsing test results: {e}")
+                                                    
+                                                    # Display evaluation criteria
+                                                    if "criteria" in judgment_explanation:
+                                                        st.markdown(f"**Scoring Criteria**: {judgment_explanation['criteria']}")
+                                                    
+                                                    if "details" in judgment_explanation:
+                                                        st.markdown(f"**Evaluation Details**: {judgment_explanation['details']}")
+                            
                             # Display evaluation rules if available
                             rules_path = os.path.join(BASE_DATA_PATH, selected_category, selected_task, "questions")
-                            if os.path.exists(rules_path):
-                                for file in os.listdir(rules_path):
-                                    if file.endswith("_rules.jsonl") or file.endswith("_rules.json"):
-                                        try:
-                                            rules_data = load_jsonl(os.path.join(rules_path, file))
-                                            for rule in rules_data:
-                                                if rule.get("question_id") == selected_question_id:
-                                                    with st.expander("Evaluation Rules"):
-                                                        st.markdown(f'<div class="question-box">{json.dumps(rule, indent=2)}</div>', unsafe_allow_html=True)
-                                                    break
-                                        except:
-                                            pass
+                            if path_exists(rules_path):
+                                rule = get_rules_index(selected_category, selected_task).get(selected_question_id)
+                                if rule is not None:
+                                    with st.expander("Evaluation Rules"):
+                                        st.markdown(f'<div class="question-box">{dumps_pretty(rule)}</div>', unsafe_allow_html=True)
                             else:
                                 st.info("No model comparison data available for this task.")
 
@@ -5,7 +5,9 @@ Common data structures and utilities.
 import dataclasses
 from datasets import load_dataset, Dataset
 from datetime import datetime
+import functools
 import glob
+import hashlib
 import json
 import os
 
@@ -34,6 +36,9 @@ LIVE_BENCH_CATEGORIES = [
 ]
 LIVE_BENCH_RELEASES = {"2024-07-26", "2024-06-24", "2024-08-31", "2024-11-25"}
 
+# Questions fetched from HuggingFace are cached here between invocations
+QUESTIONS_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "livebench", "questions")
+
 
 @dataclasses.dataclass
 class MatchSingle:
@@ -49,6 +54,7 @@ class MatchSingle:
     multi_turn: bool = False
 
 
+@functools.lru_cache(maxsize=32)
 def get_categories_tasks(bench_name: str):
     """
     Retrieve task categories and tasks themselves for a subset of LiveBench from HuggingFace.
@@ -95,6 +101,7 @@ def get_categories_tasks(bench_name: str):
     return categories, tasks
 
 
+@functools.lru_cache(maxsize=None)
 def get_hf_dataset(dataset_name: str, split="test"):
     """Load a dataset from HuggingFace using the given split."""
     return load_dataset(f"{LIVE_BENCH_HF_ORGANIZATION}/{dataset_name}", split=split)
@@ -188,7 +195,68 @@ def load_questions(
         ]
 
     if question_ids is not None:
-        questions = [q for q in questions if q['question_id'] in question_ids]
+        question_id_set = set(question_ids)
+        questions = [q for q in questions if q['question_id'] in question_id_set]
+    return questions
+
+
+def load_questions_cached(
+    category_name: str,
+    livebench_releases: set = LIVE_BENCH_RELEASES,
+    livebench_release: Optional[str] = None,
+    task_name: Optional[str] = None,
+    question_ids: Optional[list[str]] = None,
+) -> list[dict]:
+    """
+    Disk-cached wrapper around load_questions, keyed on all of its arguments.
+
+    Repeated invocations (e.g. sweeping temperatures over the same task) skip the
+    HuggingFace dataset load and question filtering entirely on a cache hit.
+    Delete ~/.cache/livebench/questions to force a refresh.
+
+    Args:
+        category_name: The name of the category whose dataset holds the questions
+        livebench_releases: A set of valid release dates. Questions with other release dates will be filtered out.
+        livebench_release: The current livebench release. If specified, questions that have been removed prior to this release will be filtered out.
+        task_name: The desired task within the category. If specified, only questions for this task will be returned.
+        question_ids: A list of question ids to include. If None, all questions will be included.
+    """
+    key_source = json.dumps([
+        category_name,
+        sorted(livebench_releases),
+        livebench_release,
+        task_name,
+        sorted(question_ids) if question_ids is not None else None,
+    ])
+    cache_file = os.path.join(
+        QUESTIONS_CACHE_DIR, hashlib.sha1(key_source.encode()).hexdigest() + ".jsonl"
+    )
+
+    if os.path.exists(cache_file):
+        try:
+            with open(cache_file, "r") as fin:
+                return [json.loads(line) for line in fin if line.strip()]
+        except (OSError, ValueError):
+            pass
+
+    questions = load_questions(
+        get_hf_dataset(category_name),
+        livebench_releases,
+        livebench_release,
+        task_name,
+        question_ids,
+    )
+
+    try:
+        os.makedirs(QUESTIONS_CACHE_DIR, exist_ok=True)
+        tmp_file = cache_file + ".tmp"
+        with open(tmp_file, "w") as fout:
+            for q in questions:
+                fout.write(json.dumps(q) + "\n")
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
     return questions
 
 
@@ -222,7 +290,8 @@ def load_questions_jsonl(
             q for q in questions if q['livebench_removal_date'] == "" or q['livebench_removal_date'] > livebench_release
         ]
     if question_ids is not None:
-        questions = [q for q in questions if q['question_id'] in question_ids]
+        question_id_set = set(question_ids)
+        questions = [q for q in questions if q['question_id'] in question_id_set]
     return questions
 
 
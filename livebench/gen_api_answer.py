@@ -5,28 +5,158 @@ python3 gen_api_answer.py --model gpt-3.5-turbo
 """
 
 import argparse
+import asyncio
+import atexit
 import json
 import os
+import queue
+import threading
 import time
 import concurrent.futures
 import glob
 import shortuuid
 import tqdm
 
+try:
+    import orjson
+
+    def _dump_line(obj) -> bytes:
+        """Serialize obj to one JSONL line (as bytes) with orjson."""
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    def _dump_line(obj) -> bytes:
+        """Serialize obj to one JSONL line (as bytes) with stdlib json."""
+        return (json.dumps(obj) + "\n").encode("utf-8")
+
 from livebench.common import (
     LIVE_BENCH_RELEASES,
     reorg_answer_file,
     get_categories_tasks,
-    load_questions,
+    load_questions_cached,
     load_questions_jsonl,
     LIVE_BENCH_DATA_SUPER_PATH,
     filter_questions
 )
-from livebench.model.completions import chat_completion_openai
+from livebench.model.completions import chat_completion_openai, chat_completion_openai_async
 
 from livebench.model import Model, get_model
 
 
+# Long-lived, lock-guarded O_APPEND descriptors per answer file, so concurrent
+# workers share one fd instead of paying open/fstat/close per answer, and every
+# append lands as a single syscall on an append-mode fd (no torn lines)
+_ANSWER_FILE_HANDLES: dict[str, tuple[int, threading.Lock]] = {}
+_ANSWER_FILE_HANDLES_LOCK = threading.Lock()
+
+
+def _get_answer_file_handle(answer_file: str) -> tuple[int, threading.Lock]:
+    """Get (creating it on first use) the shared append fd and lock for answer_file."""
+    with _ANSWER_FILE_HANDLES_LOCK:
+        entry = _ANSWER_FILE_HANDLES.get(answer_file)
+        if entry is None:
+            os.makedirs(os.path.dirname(answer_file), exist_ok=True)
+            fd = os.open(answer_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            entry = (fd, threading.Lock())
+            _ANSWER_FILE_HANDLES[answer_file] = entry
+        return entry
+
+
+@atexit.register
+def _close_answer_file_handles():
+    with _ANSWER_FILE_HANDLES_LOCK:
+        for fd, _ in _ANSWER_FILE_HANDLES.values():
+            os.close(fd)
+        _ANSWER_FILE_HANDLES.clear()
+
+
+# Background writer state: workers enqueue encoded answer lines and a single
+# consumer thread coalesces them into batched writelines calls. If a write
+# fails, the error is parked in _WRITER_ERROR and re-raised by the producers
+# and _stop_writer so the run fails loudly instead of losing answers.
+_WRITE_QUEUE: queue.Queue | None = None
+_WRITER_THREAD: threading.Thread | None = None
+_WRITER_ERROR: Exception | None = None
+_WRITE_BATCH_SIZE = 16
+
+
+def _flush_pending(pending: dict[str, list[bytes]]):
+    for answer_file, lines in pending.items():
+        fd, lock = _get_answer_file_handle(answer_file)
+        with lock:
+            # One writev syscall per batch; O_APPEND keeps the batch contiguous
+            os.writev(fd, lines)
+    pending.clear()
+
+
+def _writer_loop(write_queue: queue.Queue):
+    """Drain (answer_file, payload) items from write_queue, appending in batches
+    of up to _WRITE_BATCH_SIZE lines (or whatever arrived within 100ms)."""
+    global _WRITER_ERROR
+    pending: dict[str, list[bytes]] = {}
+    pending_count = 0
+    sentinel_seen = False
+    try:
+        while True:
+            try:
+                item = write_queue.get(timeout=0.1)
+            except queue.Empty:
+                if pending_count:
+                    _flush_pending(pending)
+                    pending_count = 0
+                continue
+            if item is None:
+                sentinel_seen = True
+                break
+            answer_file, payload = item
+            pending.setdefault(answer_file, []).append(payload)
+            pending_count += 1
+            if pending_count >= _WRITE_BATCH_SIZE:
+                _flush_pending(pending)
+                pending_count = 0
+        _flush_pending(pending)
+    except Exception as e:
+        # Record the failure, then keep draining so producers blocked on the
+        # bounded queue can finish their puts and see the error themselves.
+        # If the shutdown sentinel was already consumed there is nothing left
+        # to drain and blocking on the queue again would hang _stop_writer.
+        _WRITER_ERROR = e
+        if not sentinel_seen:
+            while write_queue.get() is not None:
+                pass
+
+
+def _start_writer(parallel: int):
+    global _WRITE_QUEUE, _WRITER_THREAD, _WRITER_ERROR
+    _WRITER_ERROR = None
+    _WRITE_QUEUE = queue.Queue(maxsize=parallel * 4)
+    _WRITER_THREAD = threading.Thread(target=_writer_loop, args=(_WRITE_QUEUE,), daemon=True)
+    _WRITER_THREAD.start()
+
+
+def _stop_writer():
+    global _WRITE_QUEUE, _WRITER_THREAD
+    if _WRITE_QUEUE is not None:
+        _WRITE_QUEUE.put(None)
+        _WRITER_THREAD.join()
+        _WRITE_QUEUE = None
+        _WRITER_THREAD = None
+        if _WRITER_ERROR is not None:
+            raise _WRITER_ERROR
+
+
+def _enqueue_answer(answer_file: str, payload: bytes):
+    """Hand one encoded answer line to the background writer; write directly when
+    no writer is running (e.g. get_answer called outside run_questions)."""
+    if _WRITE_QUEUE is not None:
+        if _WRITER_ERROR is not None:
+            raise _WRITER_ERROR
+        _WRITE_QUEUE.put((answer_file, payload))
+    else:
+        fd, lock = _get_answer_file_handle(answer_file)
+        with lock:
+            os.write(fd, payload)
+
+
 def get_answer(
     question: dict,
     model: Model,
@@ -53,20 +183,23 @@ def get_answer(
     ) is False
     
     if force_temperature is not None:
-        temperature = args.force_temperature
+        temperature = force_temperature
     elif "required_temperature" in question.keys():
         temperature = question["required_temperature"]
     else:
         temperature = 0
 
+    # Build the template once; each choice works on a fresh copy
+    base_conv = model.adapter.get_default_conv_template(model.api_name)
+
     choices = []
     total_num_tokens = 0
     for i in range(num_choices):
-        conv = model.adapter.get_default_conv_template(model.api_name)
+        conv = base_conv.copy()
 
         turns = []
-        for j in range(len(question["turns"])):
-            conv.append_message(conv.roles[0], question["turns"][j])
+        for j, prompt_text in enumerate(question["turns"]):
+            conv.append_message(conv.roles[0], prompt_text)
             conv.append_message(conv.roles[1], None)
 
             if api_dict is not None:
@@ -95,9 +228,76 @@ def get_answer(
         "total_output_tokens": total_num_tokens,
     }
 
-    os.makedirs(os.path.dirname(answer_file), exist_ok=True)
-    with open(answer_file, "a") as fout:
-        fout.write(json.dumps(ans) + "\n")
+    _enqueue_answer(answer_file, _dump_line(ans))
+
+
+async def get_answer_async(
+    question: dict,
+    model: Model,
+    num_choices: int,
+    max_tokens: int,
+    answer_file: str,
+    api_dict: dict | None = None,
+    stream: bool = False,
+    force_temperature: float | None = None
+):
+    """
+    Async counterpart of get_answer, for use with an OpenAI-compatible endpoint.
+
+    Args:
+        question: At minimum, a dictionary with a key 'turns' that maps to a list of messages in the conversation, the last of which should ask the question.
+        model: The API name for the model (e.g. gpt-4o-mini or claude-3-5-sonnet-20240620)
+        num_choices: The number of model outputs to generate for each question
+        max_tokens: The maximum number of tokens for each model response
+        answer_file: The path to the file in which to write answers
+        api_dict: A dictionary specifying the base API URL and key for model requests
+    """
+    assert api_dict is not None
+    assert (
+        force_temperature is not None and "required_temperature" in question.keys()
+    ) is False
+
+    if force_temperature is not None:
+        temperature = force_temperature
+    elif "required_temperature" in question.keys():
+        temperature = question["required_temperature"]
+    else:
+        temperature = 0
+
+    # Build the template once; each choice works on a fresh copy
+    base_conv = model.adapter.get_default_conv_template(model.api_name)
+
+    choices = []
+    total_num_tokens = 0
+    for i in range(num_choices):
+        conv = base_conv.copy()
+
+        turns = []
+        for j, prompt_text in enumerate(question["turns"]):
+            conv.append_message(conv.roles[0], prompt_text)
+            conv.append_message(conv.roles[1], None)
+
+            output, num_tokens = await chat_completion_openai_async(
+                model, conv, temperature, max_tokens, api_dict=api_dict, stream=stream
+            )
+
+            conv.update_last_message(output)
+            turns.append(output)
+            total_num_tokens += num_tokens
+
+        choices.append({"index": i, "turns": turns})
+
+    # Dump answers
+    ans = {
+        "question_id": question["question_id"],
+        "answer_id": shortuuid.uuid(),
+        "model_id": model.display_name,
+        "choices": choices,
+        "tstamp": time.time(),
+        "total_output_tokens": total_num_tokens,
+    }
+
+    _enqueue_answer(answer_file, _dump_line(ans))
 
 
 def run_questions(
@@ -123,27 +323,16 @@ def run_questions(
         parallel: The number of workers to use to make concurrent API requests
         api_dict: A dictionary specifying the base API URL and key for model requests
     """
-    if parallel == 1:
-        for question in tqdm.tqdm(questions):
-            get_answer(
-                question,
-                model,
-                num_choices,
-                max_tokens,
-                answer_file,
-                api_dict=api_dict,
-                stream=stream,
-                force_temperature=force_temperature
-            )
-        if len(questions) > 0:
-            reorg_answer_file(answer_file)
-    else:
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=parallel) as executor:
-            futures = []
-            for question in questions:
-                future = executor.submit(
-                    get_answer,
+    if len(questions) > 0:
+        # Create the shared answer file handle up front rather than in the workers,
+        # and start the background writer that coalesces their appends
+        _get_answer_file_handle(answer_file)
+        _start_writer(parallel)
+
+    try:
+        if parallel == 1:
+            for question in tqdm.tqdm(questions):
+                get_answer(
                     question,
                     model,
                     num_choices,
@@ -153,14 +342,60 @@ def run_questions(
                     stream=stream,
                     force_temperature=force_temperature
                 )
-                futures.append(future)
-
-            for future in tqdm.tqdm(
-                concurrent.futures.as_completed(futures), total=len(futures)
-            ):
-                future.result()
-        if len(questions) > 0:
-            reorg_answer_file(answer_file)
+        elif api_dict is not None:
+            # OpenAI-compatible endpoint: one event loop with a concurrency-limiting
+            # semaphore scales far better than one blocked OS thread per request
+            async def _run_async():
+                semaphore = asyncio.Semaphore(parallel)
+
+                async def run_one(question):
+                    async with semaphore:
+                        await get_answer_async(
+                            question,
+                            model,
+                            num_choices,
+                            max_tokens,
+                            answer_file,
+                            api_dict=api_dict,
+                            stream=stream,
+                            force_temperature=force_temperature
+                        )
+
+                tasks = [asyncio.ensure_future(run_one(question)) for question in questions]
+                for task in tqdm.tqdm(asyncio.as_completed(tasks), total=len(tasks)):
+                    await task
+
+            asyncio.run(_run_async())
+        else:
+            # Provider-specific api_function implementations are synchronous, so
+            # fall back to thread-based concurrency for them
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=parallel) as executor:
+                futures = []
+                for question in questions:
+                    future = executor.submit(
+                        get_answer,
+                        question,
+                        model,
+                        num_choices,
+                        max_tokens,
+                        answer_file,
+                        api_dict=api_dict,
+                        stream=stream,
+                        force_temperature=force_temperature
+                    )
+                    futures.append(future)
+
+                for future in tqdm.tqdm(
+                    concurrent.futures.as_completed(futures), total=len(futures)
+                ):
+                    future.result()
+    finally:
+        # Drain and stop the writer so every enqueued answer is on disk
+        _stop_writer()
+
+    if len(questions) > 0:
+        reorg_answer_file(answer_file)
 
 
 if __name__ == "__main__":
@@ -283,8 +518,8 @@ if __name__ == "__main__":
 
         for category_name, task_names in tasks.items():
             for task_name in task_names:
-                questions = load_questions(
-                    categories[category_name],
+                questions = load_questions_cached(
+                    category_name,
                     release_set,
                     args.livebench_release_option,
                     task_name,
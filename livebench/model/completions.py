@@ -1,6 +1,8 @@
+import asyncio
 import logging
 import os
 import sys
+import threading
 import time
 import traceback
 from typing import TYPE_CHECKING, cast
@@ -21,6 +23,61 @@ API_MAX_RETRY = 3
 API_RETRY_SLEEP = 10
 API_ERROR_OUTPUT = "$ERROR$"
 
+# Pooled OpenAI clients, one per (api_base, api_key). Rebuilding a client per
+# call discards its connection pool, so every parallel request pays a fresh
+# TCP + TLS handshake; caching them keeps connections alive across questions.
+_OPENAI_CLIENTS: dict = {}
+_OPENAI_CLIENTS_LOCK = threading.Lock()
+_OPENAI_LIMITS = httpx.Limits(max_connections=256, max_keepalive_connections=64)
+
+
+def _get_openai_client(api_dict=None):
+    from openai import OpenAI
+
+    key = ("sync", api_dict["api_base"], api_dict["api_key"]) if api_dict is not None else ("sync", None, None)
+    with _OPENAI_CLIENTS_LOCK:
+        client = _OPENAI_CLIENTS.get(key)
+        if client is None:
+            if api_dict is not None:
+                client = OpenAI(
+                    api_key=api_dict["api_key"],
+                    base_url=api_dict["api_base"],
+                    timeout=httpx.Timeout(timeout=2400.0, connect=10.0),
+                    http_client=httpx.Client(limits=_OPENAI_LIMITS),
+                )
+            else:
+                client = OpenAI(timeout=1000, http_client=httpx.Client(limits=_OPENAI_LIMITS))
+            _OPENAI_CLIENTS[key] = client
+        return client
+
+
+def _get_async_openai_client(api_dict=None):
+    from openai import AsyncOpenAI
+
+    # An async client's pooled connections belong to the event loop that
+    # created them, and run_questions starts a fresh loop per task, so the
+    # cache is additionally keyed on the running loop
+    loop = asyncio.get_running_loop()
+    key = ("async", loop, api_dict["api_base"], api_dict["api_key"]) if api_dict is not None else ("async", loop, None, None)
+    with _OPENAI_CLIENTS_LOCK:
+        client = _OPENAI_CLIENTS.get(key)
+        if client is None:
+            # Evict clients tied to loops that have since closed; their
+            # keep-alive connections can never be reused
+            for stale in [k for k in _OPENAI_CLIENTS if k[0] == "async" and k[1].is_closed()]:
+                del _OPENAI_CLIENTS[stale]
+            if api_dict is not None:
+                client = AsyncOpenAI(
+                    api_key=api_dict["api_key"],
+                    base_url=api_dict["api_base"],
+                    timeout=httpx.Timeout(timeout=2400.0, connect=10.0),
+                    http_client=httpx.AsyncClient(limits=_OPENAI_LIMITS),
+                )
+            else:
+                client = AsyncOpenAI(timeout=1000, http_client=httpx.AsyncClient(limits=_OPENAI_LIMITS))
+            _OPENAI_CLIENTS[key] = client
+        return client
+
 
 def retry_fail(_):
     print("all retries failed")
@@ -44,15 +101,9 @@ def chat_completion_openai(
     model: "Model", conv, temperature, max_tokens, api_dict=None, stream=False
 ) -> tuple[str, int]:
     from livebench.model.models import OpenAIModel
-    from openai import NOT_GIVEN, OpenAI
-
-    if api_dict is not None:
-        client = OpenAI(
-            api_key=api_dict["api_key"], base_url=api_dict["api_base"], timeout=httpx.Timeout(timeout=2400.0, connect=10.0)
-        )
+    from openai import NOT_GIVEN
 
-    else:
-        client = OpenAI(timeout=1000)
+    client = _get_openai_client(api_dict)
 
     messages = conv.to_openai_api_messages()
     if isinstance(model, OpenAIModel):
@@ -146,6 +197,114 @@ def chat_completion_openai(
         raise e
 
 
+@retry(
+    stop=stop_after_attempt(API_MAX_RETRY),
+    wait=wait_fixed(API_RETRY_SLEEP),
+    retry=retry_if_exception_type(Exception),
+    after=retry_log,
+    retry_error_callback=retry_fail
+)
+async def chat_completion_openai_async(
+    model: "Model", conv, temperature, max_tokens, api_dict=None, stream=False
+) -> tuple[str, int]:
+    """Async variant of chat_completion_openai, for use from an asyncio event loop."""
+    from livebench.model.models import OpenAIModel
+    from openai import NOT_GIVEN
+
+    client = _get_async_openai_client(api_dict)
+
+    messages = conv.to_openai_api_messages()
+    if isinstance(model, OpenAIModel):
+        for message in messages:
+            if message["role"] == "system":
+                message["role"] = "developer"
+        if model.inference_api:
+            messages[0]['content'] = 'Formatting reenabled\n' + messages[0]['content']
+    try:
+        if stream:
+            response_stream = await client.chat.completions.create(
+                model=model.api_name,
+                messages=messages,
+                n=1,
+                temperature=(
+                    temperature
+                    if not isinstance(model, OpenAIModel) or not model.inference_api
+                    else NOT_GIVEN
+                ),
+                max_completion_tokens=(
+                    max_tokens if isinstance(model, OpenAIModel) and not model.inference_api else NOT_GIVEN
+                ),
+                max_tokens=(
+                    max_tokens if not isinstance(model, OpenAIModel) else NOT_GIVEN
+                ),
+                reasoning_effort=model.api_kwargs['reasoning_effort'] if model.api_kwargs is not None and 'reasoning_effort' in model.api_kwargs else NOT_GIVEN,
+                stream=True,
+                stream_options={'include_usage': True}
+            )
+
+            message = ''
+            num_tokens = None
+            try:
+                async for chunk in response_stream:
+                    if chunk.choices and len(chunk.choices) > 0 and chunk.choices[0].delta.content is not None:
+                        message += chunk.choices[0].delta.content
+                    if chunk.usage is not None:
+                        num_tokens = chunk.usage.completion_tokens
+                        if hasattr(chunk.usage, 'reasoning_tokens'):
+                            num_tokens += chunk.usage.reasoning_tokens
+            except Exception:
+                if message != '':
+                    print(message)
+                raise
+        else:
+            response = await client.chat.completions.create(
+                model=model.api_name,
+                messages=messages,
+                n=1,
+                temperature=(
+                    temperature
+                    if not isinstance(model, OpenAIModel) or not model.inference_api
+                    else NOT_GIVEN
+                ),
+                max_completion_tokens=(
+                    max_tokens if isinstance(model, OpenAIModel) and not model.inference_api else NOT_GIVEN
+                ),
+                max_tokens=(
+                    max_tokens if not isinstance(model, OpenAIModel) else NOT_GIVEN
+                ),
+                reasoning_effort=model.api_kwargs['reasoning_effort'] if model.api_kwargs is not None and 'reasoning_effort' in model.api_kwargs else NOT_GIVEN,
+                stream=False,
+            )
+            if response is None:
+                raise Exception("No response returned from OpenAI")
+            elif response.choices is None:
+                print(response)
+                raise Exception("API request failed")
+            if isinstance(response.choices[0], str):
+                message = response.choices[0]
+            else:
+                message = response.choices[0].message.content
+            if response.usage is not None:
+                num_tokens = response.usage.completion_tokens
+                if hasattr(response.usage, 'reasoning_tokens'):
+                    num_tokens += response.usage.reasoning_tokens
+            else:
+                num_tokens = None
+
+        if message is None or message == '':
+            raise Exception("No message returned from OpenAI")
+        if num_tokens is None:
+            num_tokens = -1
+        output = message
+
+        return output, num_tokens
+    except Exception as e:
+        if "invalid_prompt" in str(e).lower():
+            print("invalid prompt, giving up")
+            return API_ERROR_OUTPUT, 0
+        raise e
+
+
 @retry(
     stop=stop_after_attempt(API_MAX_RETRY),
     wait=wait_fixed(API_RETRY_SLEEP),